@@ -1,258 +1,892 @@
 import sys
 import os
+import argparse
+import atexit
+import datetime
+import functools
+import glob
+import json
+import logging
+import pathlib
+import shelve
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pythoncom
+import pywintypes
 import win32com.client as win32
-from typing import Dict
+from winerror import DISP_E_MEMBERNOTFOUND
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple, Union
 import time
 
 
-def connect_to_solidworks():
-    """Connect to SolidWorks application"""
-    try:
-        # Try to connect to existing SolidWorks instance first
+logger = logging.getLogger(__name__)
+LOG_FORMAT = "%(levelname)s: %(message)s"
+
+STARTUP_TIMEOUT = 60  # seconds to wait for a freshly launched SolidWorks
+STARTUP_POLL_INTERVAL = 0.1
+
+# swDocumentTypes_e
+SW_DOC_PART = 1
+SW_DOC_ASSEMBLY = 2
+SW_DOC_DRAWING = 3
+
+_EXT_TO_DOCTYPE = {
+    '.sldprt': SW_DOC_PART,
+    '.sldasm': SW_DOC_ASSEMBLY,
+    '.slddrw': SW_DOC_DRAWING,
+}
+# Extensions this script currently extracts metadata from
+_VALID_EXTS = frozenset({'.sldprt'})
+
+# swOpenDocOptions_e
+SW_OPEN_SILENT = 1
+SW_OPEN_READONLY = 2
+SW_OPEN_LOAD_LIGHTWEIGHT = 128
+
+# Persistent metadata cache: one entry per (file, fields, engine), holding the
+# file's mtime and size so a changed file replaces its old entry
+CACHE_PATH = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "sw_meta_cache.db")
+CACHE_ENABLED = True
+
+# Metadata groups that can be requested; 'mass' forces a geometric
+# evaluation, so it is only read when asked for explicitly
+FIELD_GROUPS = ('custom', 'summary', 'file', 'config', 'material', 'mass')
+DEFAULT_FIELDS = ('custom', 'summary', 'file', 'config', 'material')
+
+# Number of SolidWorks licenses available to parallel workers; caps --workers
+LICENSE_COUNT_ENV = "SW_LICENSE_COUNT"
+
+# Extraction engines: the SolidWorks Document Manager reads files straight
+# from disk, the full SolidWorks application is the fallback
+ENGINES = ('docmgr', 'sldworks')
+DM_LICENSE_KEY_ENV = "SW_DM_LICENSE_KEY"
+
+# The Document Manager cannot evaluate material or mass properties
+DM_FIELD_GROUPS = ('custom', 'summary', 'file', 'config')
+
+# Custom properties always reported, empty when the part does not define them.
+# The tuple fixes their output order; the frozenset is for membership tests
+_KEY_CUSTOM_PROP_NAMES = ("Weight", "Material", "Thickness", "Description")
+_KEY_CUSTOM_PROPS = frozenset(_KEY_CUSTOM_PROP_NAMES)
+_KEY_CUSTOM_KEYS = {prop: f"Custom_{prop}" for prop in _KEY_CUSTOM_PROP_NAMES}
+
+# swSummInfoField_e ids and the names they are reported under
+_SUMMARY_FIELDS = (
+    (0, "Title"),
+    (1, "Subject"),
+    (2, "Author"),
+    (3, "Keywords"),
+    (4, "Comments"),
+    (5, "LastSavedBy"),
+    (6, "RevisionNumber"),
+    (9, "CreatedDate"),
+    (10, "ModifiedDate"),
+    (11, "LastPrintedDate"),
+)
+
+# ISwDMDocument summary properties and the Summary_* names they map to
+_DM_SUMMARY_FIELDS = (
+    ("Title", "Title"),
+    ("Subject", "Subject"),
+    ("Author", "Author"),
+    ("Keywords", "Keywords"),
+    ("Comments", "Comments"),
+    ("LastSavedBy", "LastSavedBy"),
+    ("CreateDate", "CreatedDate"),
+    ("LastSavedDate", "ModifiedDate"),
+)
+# Document Manager returns these as time_t seconds rather than formatted text
+_DM_DATE_FIELDS = frozenset(("CreateDate", "LastSavedDate"))
+
+# Every key each metadata group can produce; results start out with all of
+# them set to "" so extractors only overwrite and the dict never resizes
+_GROUP_KEYS = {
+    'custom': tuple(f"Custom_{prop}" for prop in _KEY_CUSTOM_PROP_NAMES),
+    'summary': tuple(f"Summary_{field_name}" for _, field_name in _SUMMARY_FIELDS),
+    'file': ("FileName", "FilePath"),
+    'config': ("ActiveConfiguration",),
+    'material': ("MaterialDensity",),
+    'mass': ("Mass", "Volume", "SurfaceArea"),
+}
+
+
+def _unwrap(value):
+    """Normalize a COM return that may be a bound method, a (value, ...) tuple or a plain value"""
+    if callable(value):
+        value = value()
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else ""
+    return "" if value is None else value
+
+
+def wait_for_startup(sw_app, timeout: float = STARTUP_TIMEOUT) -> bool:
+    """Wait until SolidWorks reports that its startup process has completed"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
         try:
-            sw_app = win32.GetActiveObject("SldWorks.Application")
-            print("Connected to existing SolidWorks instance")
-        except:
+            if sw_app.StartupProcessCompleted:
+                return True
+        except Exception:
+            # Application not ready to answer COM calls yet
+            pass
+        time.sleep(STARTUP_POLL_INTERVAL)
+    return False
+
+
+def connect_to_solidworks(new_instance: bool = False):
+    """Connect to SolidWorks application using early-bound (makepy) COM wrappers"""
+    try:
+        sw_app = None
+        
+        # Try to connect to existing SolidWorks instance first, unless the
+        # caller needs a private one (parallel workers)
+        if not new_instance:
+            try:
+                sw_app = win32.gencache.EnsureDispatch(win32.GetActiveObject("SldWorks.Application"))
+                logger.info("Connected to existing SolidWorks instance")
+            except pywintypes.com_error:
+                # No running instance registered; start one below
+                pass
+        
+        if sw_app is None:
             # Start new SolidWorks instance
-            sw_app = win32.Dispatch("SldWorks.Application")
-            print("Started new SolidWorks instance")
-            time.sleep(2)  # Give SolidWorks time to start
+            if new_instance:
+                sw_app = win32.gencache.EnsureDispatch(win32.DispatchEx("SldWorks.Application"))
+            else:
+                sw_app = win32.gencache.EnsureDispatch("SldWorks.Application")
+            logger.info("Started new SolidWorks instance")
+            if not wait_for_startup(sw_app):
+                logger.warning("SolidWorks did not report startup completion in time")
         
-        # Run SolidWorks in background (invisible)
-        sw_app.Visible = False
+        # Run SolidWorks in background (invisible), only touching the
+        # property when it actually needs to change
+        if sw_app.Visible:
+            sw_app.Visible = False
         return sw_app
         
     except Exception as e:
-        print(f"Failed to connect to SolidWorks: {e}")
+        logger.error("Failed to connect to SolidWorks: %s", e)
         return None
 
 
-def open_solidworks_file(sw_app, file_path: str):
-    """Open a SolidWorks part file"""
+def check_file_type(file_path: pathlib.Path) -> int:
+    """Return the swDocumentTypes_e value for a supported file, raising ValueError otherwise"""
+    file_ext = file_path.suffix.lower()
+    if file_ext not in _VALID_EXTS:
+        raise ValueError(f"Only SolidWorks part files (.sldprt) are supported. Got: {file_ext}")
+    return _EXT_TO_DOCTYPE[file_ext]
+
+
+def open_solidworks_file(sw_app, file_path: pathlib.Path):
+    """Open a SolidWorks part file given its absolute path"""
     try:
-        # Normalize the file path
-        file_path = os.path.abspath(file_path)
-        print(f"Absolute path: {file_path}")
+        logger.debug("Absolute path: %s", file_path)
         
         # Check for part file only
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext != '.sldprt':
-            raise ValueError(f"Only SolidWorks part files (.sldprt) are supported. Got: {file_ext}")
+        doc_type = check_file_type(file_path)
+        logger.debug("Document type: Part file")
         
-        doc_type = 1  # swDocPART
-        print("Document type: Part file")
+        # Metadata only: open silently and read-only so SolidWorks skips the
+        # rebuild, and keep assemblies lightweight
+        options = SW_OPEN_SILENT | SW_OPEN_READONLY
+        if doc_type == SW_DOC_ASSEMBLY:
+            options |= SW_OPEN_LOAD_LIGHTWEIGHT
         
-        # Use OpenDoc (simpler and works reliably)
-        sw_model = sw_app.OpenDoc(file_path, doc_type)
+        # Early-bound OpenDoc6 returns the in/out errors and warnings alongside the model
+        sw_model, errors, warnings = sw_app.OpenDoc6(str(file_path), doc_type, options, "", 0, 0)
         
         if not sw_model:
-            raise Exception("Failed to open file")
+            raise Exception(f"Failed to open file (errors: {errors}, warnings: {warnings})")
         
-        print(f"Successfully opened: {os.path.basename(file_path)}")
+        logger.debug("Successfully opened: %s", file_path.name)
         return sw_model
         
     except Exception as e:
-        print(f"Error opening file: {e}")
+        logger.error("Error opening file: %s", e)
         raise
 
 
-def extract_custom_properties(sw_model) -> Dict[str, str]:
-    """Extract custom properties from SolidWorks model"""
-    metadata = {}
-    key_custom_props = ["Weight", "Material", "Thickness", "Description"]
-    found_custom_props = set()
+@functools.lru_cache(maxsize=None)
+def _metadata_template(include: Tuple[str, ...]) -> Dict[str, str]:
+    """Prebuilt result dict with every key of the requested groups set to an empty string"""
+    return dict.fromkeys((key for group in FIELD_GROUPS if group in include for key in _GROUP_KEYS[group]), "")
+
+
+def new_metadata(include: Tuple[str, ...] = DEFAULT_FIELDS) -> Dict[str, str]:
+    """Return a fresh result dict pre-populated with the keys of the requested groups"""
+    return _metadata_template(include).copy()
+
+
+def find_open_document(sw_app, file_path: pathlib.Path):
+    """Return the model if SolidWorks already has the file loaded, else None"""
+    try:
+        sw_model = sw_app.GetOpenDocumentByName(str(file_path))
+    except Exception as e:
+        logger.debug("Error looking up open documents: %s", e)
+        return None
+    if sw_model:
+        logger.debug("Already open: %s", file_path.name)
+    return sw_model
+
+
+def _note_failure(failed: Optional[Set[str]], group: str):
+    """Record that a metadata group could not be read completely, if the caller is tracking failures"""
+    if failed is not None:
+        failed.add(group)
+
+
+def extract_custom_properties(sw_model, metadata: Optional[Dict[str, str]] = None,
+                              failed: Optional[Set[str]] = None, ext=None) -> Dict[str, str]:
+    """Extract custom properties from SolidWorks model; key custom properties are always present"""
+    if metadata is None:
+        metadata = dict.fromkeys(_GROUP_KEYS['custom'], "")
     
     try:
-        prop_manager = sw_model.Extension.CustomPropertyManager("")
+        if ext is None:
+            ext = sw_model.Extension
+        prop_manager = ext.CustomPropertyManager("")
         if prop_manager:
-            # Get all custom property names - handle callable vs tuple issue
-            try:
-                # Try as method call first
-                get_names_result = prop_manager.GetNames()
-            except TypeError:
-                # If it's not callable, it might be returning the result directly
-                get_names_result = getattr(prop_manager, 'GetNames', ())
+            # Read every property in one round-trip; the early-bound wrapper
+            # returns (count, names, types, values, resolved, linked); pywin32
+            # has already unpacked the SAFEARRAYs into tuples, so use them as-is
+            count, prop_names, _, values, resolved, _ = prop_manager.GetAll3(None, None, None, None, None)
+            prop_names = prop_names or ()
+            values = values or ()
+            resolved = resolved or ()
             
-            prop_names = []
-            if get_names_result and isinstance(get_names_result, tuple):
-                prop_names = list(get_names_result)
+            logger.debug("Found %d custom properties: %s", count, prop_names)
             
-            print(f"Found {len(prop_names)} custom properties: {prop_names}")
-            
-            # Extract all custom properties
-            for prop_name in prop_names:
-                try:
-                    get_result = prop_manager.Get(prop_name)
-                    if get_result and isinstance(get_result, str):
-                        metadata[f"Custom_{prop_name}"] = get_result
-                        if prop_name in key_custom_props:
-                            found_custom_props.add(prop_name)
-                except Exception as e:
-                    print(f"Error getting custom property {prop_name}: {e}")
-            
-            # Ensure key custom properties are always present
-            for key_prop in key_custom_props:
-                if key_prop not in found_custom_props:
-                    metadata[f"Custom_{key_prop}"] = ""
+            # Extract all custom properties, preferring the evaluated value
+            for prop_name, raw_value, resolved_value in zip(prop_names, values, resolved):
+                value = resolved_value or raw_value
+                if value:
+                    if prop_name in _KEY_CUSTOM_PROPS:
+                        metadata[_KEY_CUSTOM_KEYS[prop_name]] = str(value)
+                    else:
+                        metadata[f"Custom_{prop_name}"] = str(value)
                     
     except Exception as e:
-        print(f"Error accessing custom properties: {e}")
-        # Ensure key properties are present even if there's an error
-        for key_prop in key_custom_props:
-            metadata[f"Custom_{key_prop}"] = ""
+        logger.error("Error accessing custom properties: %s", e)
+        _note_failure(failed, 'custom')
     
     return metadata
 
 
-def extract_summary_info(sw_model) -> Dict[str, str]:
+def extract_summary_info(sw_model, metadata: Optional[Dict[str, str]] = None,
+                         failed: Optional[Set[str]] = None) -> Dict[str, str]:
     """Extract summary information from SolidWorks model"""
-    metadata = {}
-    summary_info_fields = {
-        0: "Title",
-        1: "Subject", 
-        2: "Author",
-        3: "Keywords",
-        4: "Comments",
-        5: "LastSavedBy",
-        6: "RevisionNumber",
-        9: "CreatedDate",
-        10: "ModifiedDate",
-        11: "LastPrintedDate"
-    }
-    
-    for field_id, field_name in summary_info_fields.items():
-        try:
-            value = sw_model.SummaryInfo(field_id)
-            if value:
-                metadata[f"Summary_{field_name}"] = str(value)
-        except:
-            continue
+    if metadata is None:
+        metadata = {}
+    
+    try:
+        # Resolve the SummaryInfo accessor once rather than per field
+        get_summary = sw_model.SummaryInfo
+        
+        for field_id, field_name in _SUMMARY_FIELDS:
+            try:
+                value = get_summary(field_id)
+                if value:
+                    metadata[f"Summary_{field_name}"] = str(value)
+            except pywintypes.com_error as e:
+                # Fields a document does not carry are expected; only log real failures
+                if e.hresult != DISP_E_MEMBERNOTFOUND:
+                    logger.debug("Error getting summary field %s: %s", field_name, e)
+                    _note_failure(failed, 'summary')
+                continue
+            except Exception as e:
+                logger.debug("Error getting summary field %s: %s", field_name, e)
+                _note_failure(failed, 'summary')
+                continue
+    except pywintypes.com_error as e:
+        if e.hresult != DISP_E_MEMBERNOTFOUND:
+            logger.error("Error getting summary info: %s", e)
+            _note_failure(failed, 'summary')
+    except Exception as e:
+        logger.error("Error getting summary info: %s", e)
+        _note_failure(failed, 'summary')
     
     return metadata
 
 
-def extract_file_properties(sw_model) -> Dict[str, str]:
+def extract_file_properties(sw_model, metadata: Optional[Dict[str, str]] = None,
+                            failed: Optional[Set[str]] = None) -> Dict[str, str]:
     """Extract file properties from SolidWorks model"""
-    metadata = {}
+    if metadata is None:
+        metadata = {}
     
     try:
-        title_result = sw_model.GetTitle
-        title = title_result() if callable(title_result) else title_result
+        title = _unwrap(sw_model.GetTitle)
         if title:
-            if isinstance(title, (list, tuple)):
-                metadata["FileName"] = str(title[0]) if len(title) > 0 else ""
-            else:
-                metadata["FileName"] = str(title)
+            metadata["FileName"] = str(title)
         
-        path_result = sw_model.GetPathName
-        path = path_result() if callable(path_result) else path_result
+        path = _unwrap(sw_model.GetPathName)
         if path:
-            if isinstance(path, (list, tuple)):
-                metadata["FilePath"] = str(path[0]) if len(path) > 0 else ""
-            else:
-                metadata["FilePath"] = str(path)
+            metadata["FilePath"] = str(path)
     except Exception as e:
-        print(f"Error getting file properties: {e}")
+        logger.error("Error getting file properties: %s", e)
+        _note_failure(failed, 'file')
     
     return metadata
 
 
-def extract_configuration_info(sw_model) -> Dict[str, str]:
+def extract_configuration_info(sw_model, metadata: Optional[Dict[str, str]] = None,
+                               failed: Optional[Set[str]] = None) -> Dict[str, str]:
     """Extract configuration information from SolidWorks model"""
-    metadata = {}
+    if metadata is None:
+        metadata = {}
     
     try:
         config_manager = sw_model.ConfigurationManager
         if config_manager:
             active_config = config_manager.ActiveConfiguration
             if active_config:
-                config_name_result = active_config.Name
-                config_name = config_name_result() if callable(config_name_result) else config_name_result
+                config_name = _unwrap(active_config.Name)
                 if config_name:
-                    if isinstance(config_name, (list, tuple)):
-                        metadata["ActiveConfiguration"] = str(config_name[0]) if len(config_name) > 0 else ""
-                    else:
-                        metadata["ActiveConfiguration"] = str(config_name)
+                    metadata["ActiveConfiguration"] = str(config_name)
+    except pywintypes.com_error as e:
+        if e.hresult != DISP_E_MEMBERNOTFOUND:
+            logger.error("Error getting configuration info: %s", e)
+            _note_failure(failed, 'config')
     except Exception as e:
-        print(f"Error getting configuration info: {e}")
+        logger.error("Error getting configuration info: %s", e)
+        _note_failure(failed, 'config')
     
     return metadata
 
 
-def extract_material_info(sw_model) -> Dict[str, str]:
+def extract_material_info(sw_model, metadata: Optional[Dict[str, str]] = None,
+                          failed: Optional[Set[str]] = None) -> Dict[str, str]:
     """Extract material information from SolidWorks model"""
-    metadata = {}
+    if metadata is None:
+        metadata = {}
     
     try:
         material_property = sw_model.MaterialPropertyValues
         if material_property and len(material_property) > 0:
             density = material_property[0]
             metadata["MaterialDensity"] = str(density) if density else ""
+    except pywintypes.com_error as e:
+        if e.hresult != DISP_E_MEMBERNOTFOUND:
+            logger.error("Error getting material properties: %s", e)
+            _note_failure(failed, 'material')
     except Exception as e:
-        print(f"Error getting material properties: {e}")
+        logger.error("Error getting material properties: %s", e)
+        _note_failure(failed, 'material')
     
     return metadata
 
 
-def read_metadata(file_path: str) -> Dict[str, str]:
-    """Read metadata from SolidWorks file, always including key custom properties if present, and all native metadata."""
-    metadata = {}
-    sw_app = None
-    sw_model = None
+def extract_mass_properties(sw_model, metadata: Optional[Dict[str, str]] = None,
+                            failed: Optional[Set[str]] = None, ext=None) -> Dict[str, str]:
+    """Extract mass properties from SolidWorks model (triggers a geometric evaluation)"""
+    if metadata is None:
+        metadata = {}
     
     try:
-        # Connect to SolidWorks
-        sw_app = connect_to_solidworks()
-        if not sw_app:
-            return metadata
-        
-        # Open the file
-        sw_model = open_solidworks_file(sw_app, file_path)
-        
-        # Extract all metadata
-        metadata.update(extract_custom_properties(sw_model))
-        metadata.update(extract_summary_info(sw_model))
-        metadata.update(extract_file_properties(sw_model))
-        metadata.update(extract_configuration_info(sw_model))
-        metadata.update(extract_material_info(sw_model))
-        
+        if ext is None:
+            ext = sw_model.Extension
+        mass_property = ext.CreateMassProperty()
+        if mass_property:
+            metadata["Mass"] = str(mass_property.Mass)
+            metadata["Volume"] = str(mass_property.Volume)
+            metadata["SurfaceArea"] = str(mass_property.SurfaceArea)
     except Exception as e:
-        print(f"Error reading metadata: {e}")
-    finally:
-        # Clean up COM objects
-        if sw_model:
-            sw_model = None
-        if sw_app:
-            sw_app = None
+        logger.error("Error getting mass properties: %s", e)
+        _note_failure(failed, 'mass')
     
     return metadata
 
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python SW_Metadata_Extract.py <path_to_solidworks_part_file>")
-        print("Supported files: .sldprt only")
-        return
+def _extract_all(sw_model, out: Dict[str, str], include: Tuple[str, ...] = DEFAULT_FIELDS,
+                 failed: Optional[Set[str]] = None) -> Dict[str, str]:
+    """Run the requested extractors in one pass, writing straight into out and any failed groups into failed"""
+    # Fetch the ModelDocExtension once for the extractors that need it; if
+    # this fails they retry it themselves and report the error per group
+    ext = None
+    if 'custom' in include or 'mass' in include:
+        try:
+            ext = sw_model.Extension
+        except Exception as e:
+            logger.debug("Error getting model extension: %s", e)
     
-    file_path = sys.argv[1]
+    if 'custom' in include:
+        extract_custom_properties(sw_model, out, failed, ext)
+    if 'summary' in include:
+        extract_summary_info(sw_model, out, failed)
+    if 'file' in include:
+        extract_file_properties(sw_model, out, failed)
+    if 'config' in include:
+        extract_configuration_info(sw_model, out, failed)
+    if 'material' in include:
+        extract_material_info(sw_model, out, failed)
+    if 'mass' in include:
+        extract_mass_properties(sw_model, out, failed, ext)
+    return out
+
+
+def connect_to_document_manager(license_key: str):
+    """Connect to the SolidWorks Document Manager, which reads files without starting SolidWorks"""
+    try:
+        dm_factory = win32.gencache.EnsureDispatch("SwDocumentMgr.SwDMClassFactory")
+        dm_app = dm_factory.GetApplication(license_key)
+        if not dm_app:
+            raise RuntimeError("Document Manager rejected the license key")
+        return dm_app
+    except Exception as e:
+        logger.error("Failed to connect to SolidWorks Document Manager: %s", e)
+        return None
+
+
+def open_dm_document(dm_app, file_path: pathlib.Path):
+    """Open a SolidWorks file read-only through the Document Manager, given its absolute path"""
+    doc_type = check_file_type(file_path)
     
-    if not os.path.exists(file_path):
-        print(f"File not found: {file_path}")
-        return
+    # Early-bound GetDocument returns the swDmDocumentOpenError_e status alongside the document
+    dm_doc, status = dm_app.GetDocument(str(file_path), doc_type, True, 0)
+    if not dm_doc:
+        raise Exception(f"Failed to open file (status: {status})")
     
-    # Check file extension
-    file_ext = os.path.splitext(file_path)[1].lower()
-    if file_ext != '.sldprt':
-        print(f"Unsupported file type: {file_ext}")
-        print("This script only supports SolidWorks part files (.sldprt)")
-        return
+    logger.debug("Successfully opened: %s", file_path.name)
+    return dm_doc
+
+
+def format_dm_date(timestamp) -> str:
+    """Format a Document Manager time_t the way SolidWorks SummaryInfo reports dates"""
+    dt = datetime.datetime.fromtimestamp(timestamp)
+    hour = dt.hour % 12 or 12
+    return f"{dt:%A}, {dt:%B} {dt.day}, {dt.year} {hour}:{dt:%M:%S} {dt:%p}"
+
+
+def extract_dm_custom_properties(dm_doc, metadata: Optional[Dict[str, str]] = None,
+                                 failed: Optional[Set[str]] = None) -> Dict[str, str]:
+    """Extract custom properties from a Document Manager document; key custom properties are always present"""
+    if metadata is None:
+        metadata = dict.fromkeys(_GROUP_KEYS['custom'], "")
+    
+    try:
+        prop_names = dm_doc.GetCustomPropertyNames() or ()
+    except Exception as e:
+        logger.error("Error accessing custom properties: %s", e)
+        _note_failure(failed, 'custom')
+        return metadata
+    
+    logger.debug("Found %d custom properties: %s", len(prop_names), prop_names)
     
-    print(f"Reading metadata from: {file_path}")
-    print("-" * 50)
+    for prop_name in prop_names:
+        try:
+            # GetCustomPropertyValues returns the evaluated value (matching the
+            # resolved value from GetAll3), plus the swDmCustomInfoType and link text
+            value, _, _ = dm_doc.GetCustomPropertyValues(prop_name, 0, "")
+            if value:
+                if prop_name in _KEY_CUSTOM_PROPS:
+                    metadata[_KEY_CUSTOM_KEYS[prop_name]] = str(value)
+                else:
+                    metadata[f"Custom_{prop_name}"] = str(value)
+        except Exception as e:
+            logger.error("Error getting custom property %s: %s", prop_name, e)
+            _note_failure(failed, 'custom')
     
-    metadata = read_metadata(file_path)
+    return metadata
+
+
+def extract_dm_summary_info(dm_doc, metadata: Optional[Dict[str, str]] = None,
+                            failed: Optional[Set[str]] = None) -> Dict[str, str]:
+    """Extract summary information from a Document Manager document"""
+    if metadata is None:
+        metadata = {}
     
-    if metadata:
+    for attr_name, field_name in _DM_SUMMARY_FIELDS:
+        try:
+            value = getattr(dm_doc, attr_name)
+            if value:
+                if attr_name in _DM_DATE_FIELDS:
+                    value = format_dm_date(value)
+                metadata[f"Summary_{field_name}"] = str(value)
+        except (pywintypes.com_error, AttributeError, ValueError, OverflowError, OSError) as e:
+            logger.debug("Error getting summary field %s: %s", field_name, e)
+            _note_failure(failed, 'summary')
+            continue
+    
+    return metadata
+
+
+def extract_dm_configuration_info(dm_doc, metadata: Optional[Dict[str, str]] = None,
+                                  failed: Optional[Set[str]] = None) -> Dict[str, str]:
+    """Extract configuration information from a Document Manager document"""
+    if metadata is None:
+        metadata = {}
+    
+    try:
+        config_name = _unwrap(dm_doc.ConfigurationManager.GetActiveConfigurationName)
+        if config_name:
+            metadata["ActiveConfiguration"] = str(config_name)
+    except Exception as e:
+        logger.error("Error getting configuration info: %s", e)
+        _note_failure(failed, 'config')
+    
+    return metadata
+
+
+def open_metadata_cache():
+    """Open the metadata cache for a session or batch, or return None if it is disabled or unavailable"""
+    if not CACHE_ENABLED:
+        return None
+    try:
+        return shelve.open(CACHE_PATH)
+    except Exception as e:
+        logger.warning("Error opening metadata cache: %s", e)
+        return None
+
+
+def close_metadata_cache(cache):
+    """Close a cache returned by open_metadata_cache"""
+    if cache is not None:
+        try:
+            cache.close()
+        except Exception as e:
+            logger.warning("Error closing metadata cache: %s", e)
+
+
+def metadata_cache_key(file_path: pathlib.Path, include: Tuple[str, ...] = DEFAULT_FIELDS,
+                       engine: str = "sldworks") -> str:
+    """Build a cache key from the absolute path, requested fields and engine"""
+    return f"{file_path}|{','.join(sorted(include))}|{engine}"
+
+
+def file_signature(file_path: pathlib.Path) -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) identifying the file's current contents, or None if it cannot be stat'd"""
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        logger.warning("Not caching %s: %s", file_path, e)
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_cached_metadata(cache, key: str, signature: Optional[Tuple[int, int]]):
+    """Return cached metadata if the entry matches the file's signature, or None on a miss"""
+    if cache is None or signature is None:
+        return None
+    try:
+        entry = cache.get(key)
+    except Exception as e:
+        logger.warning("Error reading metadata cache: %s", e)
+        return None
+    if entry is None or tuple(entry[:2]) != signature:
+        return None
+    return entry[2]
+
+
+def store_cached_metadata(cache, key: str, signature: Optional[Tuple[int, int]], metadata: Dict[str, str]):
+    """Store metadata in the cache, replacing any older entry for the same file; failed (empty) reads are not cached"""
+    if cache is None or signature is None or not any(metadata.values()):
+        return
+    try:
+        cache[key] = (signature[0], signature[1], metadata)
+    except Exception as e:
+        logger.warning("Error writing metadata cache: %s", e)
+
+
+def cached_metadata(read_func):
+    """Serve metadata from the session's cache, reading the file only on a miss"""
+    @functools.wraps(read_func)
+    def wrapper(self, file_path, include=DEFAULT_FIELDS):
+        # Normalize once; everything downstream works on the absolute Path
+        # and a tuple of groups, which is checked several times
+        file_path = pathlib.Path(file_path).absolute()
+        include = tuple(include)
+        # read_func clears this when its result may not reflect the file on
+        # disk or a requested group could not be read completely
+        self.cacheable = True
+        if self.cache is None:
+            return read_func(self, file_path, include)
+        
+        key = metadata_cache_key(file_path, include, self.engine)
+        signature = file_signature(file_path)
+        metadata = load_cached_metadata(self.cache, key, signature)
+        if metadata is None:
+            metadata = read_func(self, file_path, include)
+            if self.cacheable:
+                store_cached_metadata(self.cache, key, signature, metadata)
+        return metadata
+    
+    return wrapper
+
+
+def close_solidworks_file(sw_app, sw_model):
+    """Close an open SolidWorks document, leaving the application running"""
+    try:
+        title = _unwrap(sw_model.GetTitle)
+        if title:
+            sw_app.CloseDoc(str(title))
+    except Exception as e:
+        logger.warning("Error closing file: %s", e)
+
+
+class SolidWorksSession:
+    """Context manager holding a single SolidWorks connection across many files"""
+
+    engine = "sldworks"
+
+    def __init__(self, exit_on_close: bool = False, new_instance: bool = False):
+        self.exit_on_close = exit_on_close
+        self.new_instance = new_instance
+        self.sw_app = None
+        self.cache = None
+        self.cacheable = True
+
+    def __enter__(self):
+        # SolidWorks is connected lazily so fully cached batches never start it
+        self.cache = open_metadata_cache()
+        return self
+
+    def get_app(self):
+        """Return the SolidWorks application, connecting on first use"""
+        if not self.sw_app:
+            self.sw_app = connect_to_solidworks(self.new_instance)
+            if not self.sw_app:
+                raise RuntimeError("Could not connect to SolidWorks")
+        return self.sw_app
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.sw_app and self.exit_on_close:
+            try:
+                self.sw_app.ExitApp()
+            except Exception as e:
+                logger.warning("Error closing SolidWorks: %s", e)
+        # Release the COM reference
+        self.sw_app = None
+        close_metadata_cache(self.cache)
+        self.cache = None
+        return False
+
+    @cached_metadata
+    def read(self, file_path: Union[str, pathlib.Path], include: Tuple[str, ...] = DEFAULT_FIELDS) -> Dict[str, str]:
+        """Read the requested metadata groups (see FIELD_GROUPS) from a single file"""
+        metadata = new_metadata(include)
+        sw_model = None
+        opened_here = False
+        
+        try:
+            # Reject unsupported files before paying for a SolidWorks connection
+            check_file_type(file_path)
+            
+            # Reuse the document if it is already loaded, otherwise open it
+            sw_app = self.get_app()
+            sw_model = find_open_document(sw_app, file_path)
+            if sw_model:
+                # An already-open document may hold unsaved edits, so what is
+                # read from it must not be cached against the file on disk
+                self.cacheable = False
+            else:
+                sw_model = open_solidworks_file(sw_app, file_path)
+                opened_here = True
+            
+            # Extract the requested metadata; a partial result must not be cached
+            failed = set()
+            _extract_all(sw_model, metadata, include, failed)
+            if failed:
+                logger.debug("Not caching %s; incomplete groups: %s", file_path.name, ", ".join(sorted(failed)))
+                self.cacheable = False
+            
+        except Exception as e:
+            logger.error("Error reading metadata: %s", e)
+            self.cacheable = False
+        finally:
+            # Close documents we opened but keep SolidWorks alive for the next
+            # file; documents that were already open are left as they were
+            if sw_model and opened_here:
+                close_solidworks_file(self.sw_app, sw_model)
+            sw_model = None
+        
+        return metadata
+
+    def read_many(self, file_paths: Iterable[pathlib.Path],
+                  include: Iterable[str] = DEFAULT_FIELDS) -> Iterator[Tuple[pathlib.Path, Dict[str, str]]]:
+        """Yield (path, metadata) for each file, reusing the same SolidWorks instance"""
+        include = tuple(include)
+        for file_path in file_paths:
+            yield file_path, self.read(file_path, include)
+
+
+class DocumentManagerSession:
+    """Context manager reading files through the SolidWorks Document Manager (no SolidWorks process)"""
+
+    engine = "docmgr"
+
+    def __init__(self, license_key: str):
+        self.license_key = license_key
+        self.dm_app = None
+        self.cache = None
+        self.cacheable = True
+
+    def __enter__(self):
+        self.cache = open_metadata_cache()
+        return self
+
+    def get_app(self):
+        """Return the Document Manager application, connecting on first use"""
+        if not self.dm_app:
+            self.dm_app = connect_to_document_manager(self.license_key)
+            if not self.dm_app:
+                raise RuntimeError("Could not connect to SolidWorks Document Manager")
+        return self.dm_app
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Release the COM reference
+        self.dm_app = None
+        close_metadata_cache(self.cache)
+        self.cache = None
+        return False
+
+    @cached_metadata
+    def read(self, file_path: Union[str, pathlib.Path], include: Tuple[str, ...] = DEFAULT_FIELDS) -> Dict[str, str]:
+        """Read the requested metadata groups from a single file; material and mass need the sldworks engine"""
+        if 'material' in include or 'mass' in include:
+            # Leave them out rather than report (and cache) blank values
+            logger.debug("Material and mass properties are not available from the Document Manager")
+            include = tuple(group for group in include if group in DM_FIELD_GROUPS)
+        metadata = new_metadata(include)
+        dm_doc = None
+        
+        try:
+            check_file_type(file_path)
+            dm_doc = open_dm_document(self.get_app(), file_path)
+            
+            failed = set()
+            if 'custom' in include:
+                extract_dm_custom_properties(dm_doc, metadata, failed)
+            if 'summary' in include:
+                extract_dm_summary_info(dm_doc, metadata, failed)
+            if 'file' in include:
+                metadata["FileName"] = file_path.name
+                metadata["FilePath"] = str(file_path)
+            if 'config' in include:
+                extract_dm_configuration_info(dm_doc, metadata, failed)
+            # A partial result must not be cached
+            if failed:
+                logger.debug("Not caching %s; incomplete groups: %s", file_path.name, ", ".join(sorted(failed)))
+                self.cacheable = False
+            
+        except Exception as e:
+            logger.error("Error reading metadata: %s", e)
+            self.cacheable = False
+        finally:
+            if dm_doc:
+                try:
+                    dm_doc.CloseDoc()
+                except Exception as e:
+                    logger.warning("Error closing file: %s", e)
+                dm_doc = None
+        
+        return metadata
+
+    def read_many(self, file_paths: Iterable[pathlib.Path],
+                  include: Iterable[str] = DEFAULT_FIELDS) -> Iterator[Tuple[pathlib.Path, Dict[str, str]]]:
+        """Yield (path, metadata) for each file"""
+        include = tuple(include)
+        for file_path in file_paths:
+            yield file_path, self.read(file_path, include)
+
+
+# Per-process session used by parallel workers
+_worker_session = None
+
+
+def _close_sw_worker():
+    """Shut down the worker's private SolidWorks instance when the process exits"""
+    if _worker_session:
+        _worker_session.__exit__(None, None, None)
+    pythoncom.CoUninitialize()
+
+
+def _init_sw_worker(log_level: int = logging.WARNING):
+    """Process pool initializer: set up logging, COM and a private SolidWorks session"""
+    global _worker_session, CACHE_ENABLED
+    # Spawned workers start with unconfigured logging; match the parent's level
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    pythoncom.CoInitialize()
+    # The parent process owns the cache; shelve does not support concurrent writers
+    CACHE_ENABLED = False
+    _worker_session = SolidWorksSession(exit_on_close=True, new_instance=True)
+    atexit.register(_close_sw_worker)
+
+
+def _read_in_worker(file_path: pathlib.Path, include: Tuple[str, ...]) -> Tuple[Dict[str, str], bool]:
+    """Read one file with the worker's SolidWorks session; also return whether the result may be cached"""
+    metadata = _worker_session.read(file_path, include)
+    return metadata, _worker_session.cacheable
+
+
+def read_many_parallel(file_paths: Iterable[pathlib.Path], workers: int,
+                       include: Iterable[str] = DEFAULT_FIELDS) -> Iterator[Tuple[pathlib.Path, Dict[str, str]]]:
+    """Yield (path, metadata) as files complete, spreading them over several SolidWorks processes"""
+    include = tuple(include)
+    cache = open_metadata_cache()
+    try:
+        pending = {}
+        for file_path in file_paths:
+            key = metadata_cache_key(file_path, include)
+            signature = file_signature(file_path) if cache is not None else None
+            metadata = load_cached_metadata(cache, key, signature)
+            if metadata is None:
+                pending[file_path] = (key, signature)
+            else:
+                yield file_path, metadata
+        
+        if not pending:
+            return
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), initializer=_init_sw_worker,
+                                 initargs=(logging.getLogger().getEffectiveLevel(),)) as executor:
+            futures = {executor.submit(_read_in_worker, file_path, include): file_path for file_path in pending}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    metadata, cacheable = future.result()
+                except Exception as e:
+                    logger.error("Error reading metadata: %s", e)
+                    metadata, cacheable = {}, False
+                if cacheable:
+                    key, signature = pending[file_path]
+                    store_cached_metadata(cache, key, signature, metadata)
+                yield file_path, metadata
+    finally:
+        close_metadata_cache(cache)
+
+
+def license_count() -> int:
+    """Number of SolidWorks licenses available for parallel workers (default 1)"""
+    try:
+        return max(1, int(os.environ.get(LICENSE_COUNT_ENV, "1")))
+    except ValueError:
+        logger.warning("Ignoring invalid %s value: %s", LICENSE_COUNT_ENV, os.environ[LICENSE_COUNT_ENV])
+        return 1
+
+
+def expand_input_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """Expand directories (to their .sldprt files) and glob patterns into file paths"""
+    for entry in inputs:
+        if os.path.isdir(entry):
+            yield from sorted(glob.glob(os.path.join(entry, "*.sldprt")))
+        elif glob.has_magic(entry):
+            yield from sorted(glob.glob(entry, recursive=True))
+        else:
+            yield entry
+
+
+def read_metadata(file_path: Union[str, pathlib.Path], include: Iterable[str] = DEFAULT_FIELDS) -> Dict[str, str]:
+    """Read metadata from SolidWorks file, always including key custom properties if present, and all native metadata."""
+    try:
+        with SolidWorksSession() as session:
+            return session.read(file_path, include)
+    except Exception as e:
+        logger.error("Error reading metadata: %s", e)
+        return {}
+
+
+def print_metadata(metadata: Dict[str, str]):
+    """Print extracted metadata as an aligned key/value listing"""
+    if any(metadata.values()):
         print("SolidWorks File Metadata:")
         print("=" * 50)
         for key, value in sorted(metadata.items()):
@@ -264,5 +898,121 @@ def main():
         print("No metadata could be extracted.")
 
 
+def print_results(results: Iterable[Tuple[pathlib.Path, Dict[str, str]]], output_format: str = "human"):
+    """Print (path, metadata) pairs as they become available, as a report or one JSON object per line"""
+    if output_format == "jsonl":
+        # JSON Lines is UTF-8; a redirected Windows stdout would otherwise use
+        # the ANSI code page and fail on any character outside it
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(encoding="utf-8")
+        for file_path, metadata in results:
+            try:
+                sys.stdout.write(json.dumps({"path": str(file_path), **metadata}, default=str, ensure_ascii=False) + "\n")
+                sys.stdout.flush()
+            except ValueError as e:
+                logger.error("Error writing metadata for %s: %s", file_path, e)
+        return
+    
+    for file_path, metadata in results:
+        # One file whose values the console cannot encode must not end the batch
+        try:
+            print(f"Reading metadata from: {file_path}")
+            print("-" * 50)
+            print_metadata(metadata)
+            print()
+        except ValueError as e:
+            logger.error("Error writing metadata for %s: %s", file_path, e)
+
+
+def parse_fields(value: str) -> Tuple[str, ...]:
+    """Parse a comma-separated --fields value into a tuple of metadata groups"""
+    fields = tuple(field.strip().lower() for field in value.split(",") if field.strip())
+    unknown = [field for field in fields if field not in FIELD_GROUPS]
+    if unknown or not fields:
+        raise argparse.ArgumentTypeError(
+            f"invalid fields {', '.join(unknown) or value!r}; choose from {', '.join(FIELD_GROUPS)}")
+    return fields
+
+
+def main():
+    global CACHE_ENABLED
+    
+    parser = argparse.ArgumentParser(description="Extract metadata from SolidWorks part files (.sldprt)")
+    parser.add_argument("files", nargs="+", help="SolidWorks part file, directory or glob pattern")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the metadata cache")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"number of parallel SolidWorks processes (capped by ${LICENSE_COUNT_ENV})")
+    parser.add_argument("--fields", type=parse_fields,
+                        help=f"comma-separated metadata groups to read (default: {','.join(DEFAULT_FIELDS)}, "
+                             f"or {','.join(DM_FIELD_GROUPS)} with docmgr; available: {','.join(FIELD_GROUPS)})")
+    parser.add_argument("--engine", choices=ENGINES, default="docmgr",
+                        help="docmgr reads files directly via the Document Manager (needs a license key); "
+                             "sldworks drives the full SolidWorks application")
+    parser.add_argument("--dm-key", default=os.environ.get(DM_LICENSE_KEY_ENV),
+                        help=f"Document Manager license key (default: ${DM_LICENSE_KEY_ENV})")
+    parser.add_argument("--format", choices=("human", "jsonl"), default="human",
+                        help="human-readable report or one JSON object per file (JSON Lines)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show debug output")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format=LOG_FORMAT)
+    
+    CACHE_ENABLED = not args.no_cache
+    
+    file_paths = []
+    for entry in expand_input_paths(args.files):
+        # Resolve once; the Path is shared by validation, caching and the COM calls
+        try:
+            file_path = pathlib.Path(entry).resolve(strict=True)
+        except OSError:
+            logger.error("File not found: %s", entry)
+            continue
+        
+        # Check file extension
+        try:
+            check_file_type(file_path)
+        except ValueError as e:
+            logger.error("Skipping %s: %s", file_path, e)
+            continue
+        
+        file_paths.append(file_path)
+    
+    if not file_paths:
+        return
+    
+    engine = args.engine
+    if engine == "docmgr" and not args.dm_key:
+        logger.info("No Document Manager license key configured (set %s or --dm-key); using SolidWorks",
+                    DM_LICENSE_KEY_ENV)
+        engine = "sldworks"
+    
+    if engine == "docmgr" and args.workers > 1:
+        logger.warning("--workers is ignored with the docmgr engine; it only applies to --engine sldworks")
+    
+    fields = args.fields or DEFAULT_FIELDS
+    if engine == "docmgr":
+        unsupported = [field for field in fields if field not in DM_FIELD_GROUPS]
+        if unsupported and args.fields:
+            logger.warning("%s not available with the docmgr engine; use --engine sldworks to read them",
+                           ", ".join(unsupported))
+        fields = tuple(field for field in fields if field in DM_FIELD_GROUPS)
+        if not fields:
+            return
+    
+    workers = min(max(1, args.workers), license_count(), len(file_paths))
+    
+    try:
+        if engine == "docmgr":
+            with DocumentManagerSession(args.dm_key) as session:
+                print_results(session.read_many(file_paths, fields), args.format)
+        elif workers > 1:
+            print_results(read_many_parallel(file_paths, workers, fields), args.format)
+        else:
+            with SolidWorksSession() as session:
+                print_results(session.read_many(file_paths, fields), args.format)
+    except Exception as e:
+        logger.error("Error reading metadata: %s", e)
+
+
 if __name__ == "__main__":
     main()